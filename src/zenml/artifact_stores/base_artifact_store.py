@@ -211,9 +211,7 @@ class BaseArtifactStoreConfig(StackComponentConfig):
                 )
             )
         values["path"] = values["path"].strip("'\"`")
-        if not any(
-            values["path"].startswith(i) for i in cls.SUPPORTED_SCHEMES
-        ):
+        if not values["path"].startswith(tuple(cls.SUPPORTED_SCHEMES)):
             raise ArtifactStoreInterfaceError(
                 f"The path: '{values['path']}' you defined for your "
                 f"artifact store is not supported by the implementation of "
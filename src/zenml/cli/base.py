@@ -14,6 +14,7 @@
 """Base functionality for the CLI."""
 
 import os
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
@@ -48,7 +49,7 @@ from zenml.exceptions import GitNotFoundError, InitializationException
 from zenml.integrations.registry import integration_registry
 from zenml.io import fileio
 from zenml.logger import get_logger
-from zenml.utils.io_utils import copy_dir, get_global_config_directory
+from zenml.utils.io_utils import get_global_config_directory
 from zenml.utils.yaml_utils import write_yaml
 from zenml.zen_server.utils import get_active_deployment
 
@@ -58,6 +59,7 @@ logger = get_logger(__name__)
 _SHOW_EMOJIS = not os.name == "nt" or os.environ.get("WT_SESSION")
 
 TUTORIAL_REPO = "https://github.com/zenml-io/zenml"
+TUTORIAL_EXAMPLE_PATH = "examples/quickstart"
 
 
 class ZenMLProjectTemplateLocation(BaseModel):
@@ -437,6 +439,7 @@ def go() -> None:
 
         if not os.path.isdir(zenml_tutorial_path):
             try:
+                from git.exc import GitCommandError
                 from git.repo.base import Repo
             except ImportError as e:
                 cli_utils.error(
@@ -455,15 +458,43 @@ def go() -> None:
                 with console.status(
                     "Cloning tutorial. This sometimes takes a minute..."
                 ):
-                    Repo.clone_from(
-                        TUTORIAL_REPO,
-                        tmp_cloned_dir,
-                        branch=f"release/{zenml_version}",
-                    )
+                    # We only need the quickstart example, so we do a
+                    # partial clone without blobs and sparsely check out the
+                    # example directory instead of the entire repository.
+                    try:
+                        repo = Repo.clone_from(
+                            TUTORIAL_REPO,
+                            tmp_cloned_dir,
+                            branch=f"release/{zenml_version}",
+                            depth=1,
+                            single_branch=True,
+                            filter="blob:none",
+                            sparse=True,
+                        )
+                        repo.git.sparse_checkout("set", TUTORIAL_EXAMPLE_PATH)
+                    except GitCommandError:
+                        # Partial clones and sparse checkouts require a
+                        # recent git version and server support, so we fall
+                        # back to a regular shallow clone.
+                        logger.debug(
+                            "Sparse clone of the tutorial failed, falling "
+                            "back to a shallow clone.",
+                            exc_info=True,
+                        )
+                        shutil.rmtree(tmp_cloned_dir, ignore_errors=True)
+                        Repo.clone_from(
+                            TUTORIAL_REPO,
+                            tmp_cloned_dir,
+                            branch=f"release/{zenml_version}",
+                            depth=1,
+                            single_branch=True,
+                        )
                 example_dir = os.path.join(
-                    tmp_cloned_dir, "examples/quickstart"
+                    tmp_cloned_dir, TUTORIAL_EXAMPLE_PATH
                 )
-                copy_dir(example_dir, zenml_tutorial_path)
+                # The clone is discarded afterwards, so we can move the
+                # example out of it instead of copying every file.
+                shutil.move(example_dir, zenml_tutorial_path)
         else:
             cli_utils.warning(
                 f"{zenml_tutorial_path} already exists! Continuing without "
@@ -807,6 +807,7 @@ def _validate_repository(
                     commit=commit,
                     branch=branch,
                     to_path=tmp_dir,
+                    depth=1,
                 )
 
                 # Check if the subdir exists and has the correct structure.
@@ -825,7 +825,8 @@ def generate_stack_component_logs_command(
                 cli_utils.declare(f"Stopped following {display_name} logs.")
         else:
             with open(log_file, "r") as f:
-                click.echo(f.read())
+                for line in f:
+                    click.echo(line, nl=False)
 
     return stack_component_logs_command
 
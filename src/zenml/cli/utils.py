@@ -18,6 +18,7 @@ import datetime
 import json
 import os
 import re
+import stat
 import subprocess
 import sys
 from typing import (
@@ -275,6 +276,7 @@ def print_pydantic_models(
     if active_models is None:
         show_active_column = False
         active_models = list()
+    active_ids = {a.id for a in active_models}
 
     def __dictify(model: T) -> Dict[str, str]:
         """Helper function to map over the list to turn Models into dicts.
@@ -354,24 +356,21 @@ def print_pydantic_models(
             marker = "current"
         if active_models is not None and show_active_column:
             return {
-                marker: (
-                    ":point_right:"
-                    if any(model.id == a.id for a in active_models)
-                    else ""
-                ),
+                marker: ":point_right:" if model.id in active_ids else "",
                 **items,
             }
 
         return items
 
-    active_ids = [a.id for a in active_models]
     if isinstance(models, Page):
         table_items = list(models.items)
 
         if show_active:
+            table_ids = {i.id for i in table_items}
             for active_model in active_models:
-                if active_model.id not in [i.id for i in table_items]:
+                if active_model.id not in table_ids:
                     table_items.append(active_model)
+                    table_ids.add(active_model.id)
 
             table_items = [i for i in table_items if i.id in active_ids] + [
                 i for i in table_items if i.id not in active_ids
@@ -383,9 +382,11 @@ def print_pydantic_models(
         table_items = list(models)
 
         if show_active:
+            table_ids = {i.id for i in table_items}
             for active_model in active_models:
-                if active_model.id not in [i.id for i in table_items]:
+                if active_model.id not in table_ids:
                     table_items.append(active_model)
+                    table_ids.add(active_model.id)
 
             table_items = [i for i in table_items if i.id in active_ids] + [
                 i for i in table_items if i.id not in active_ids
@@ -731,13 +732,17 @@ def expand_argument_value_from_file(name: str, value: str) -> str:
     logger.info(
         f"Expanding argument value `{name}` to contents of file `{filename}`."
     )
-    if not os.path.isfile(filename):
+    try:
+        file_stat = os.stat(filename)
+    except OSError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
         raise ValueError(
             f"Could not load argument '{name}' value: file "
             f"'{filename}' does not exist or is not readable."
         )
     try:
-        if os.path.getsize(filename) > MAX_ARGUMENT_VALUE_SIZE:
+        if file_stat.st_size > MAX_ARGUMENT_VALUE_SIZE:
             raise ValueError(
                 f"Could not load argument '{name}' value: file "
                 f"'{filename}' is too large (max size is "
@@ -890,9 +895,12 @@ def parse_unknown_component_attributes(args: List[str]) -> List[str]:
         "--custom_attribute"
     )
 
-    assert all(a.startswith("--") for a in args), warning_message
-    p_args = [a.lstrip("-") for a in args]
-    assert all(v.isidentifier() for v in p_args), warning_message
+    p_args = []
+    for a in args:
+        assert a.startswith("--"), warning_message
+        key = a[2:]
+        assert key.isidentifier(), warning_message
+        p_args.append(key)
     return p_args
 
 
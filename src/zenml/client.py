@@ -191,6 +191,7 @@ from zenml.utils.pagination_utils import depaginate
 from zenml.utils.uuid_utils import is_valid_uuid
 
 if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
     from zenml.metadata.metadata_types import MetadataType, MetadataTypeEnum
     from zenml.service_connectors.service_connector import ServiceConnector
     from zenml.stack import Stack
@@ -373,6 +374,7 @@ class Client(metaclass=ClientMetaClass):
         """
         self._root: Optional[Path] = None
         self._config: Optional[ClientConfiguration] = None
+        self._workspace_cache: Dict[str, WorkspaceResponse] = {}
 
         self._set_active_root(root)
 
@@ -589,7 +591,7 @@ class Client(metaclass=ClientMetaClass):
             )
 
         def _find_repository_helper(path_: Path) -> Optional[Path]:
-            """Recursively search parent directories for a ZenML repository.
+            """Search a path and its parent directories for a ZenML repository.
 
             Args:
                 path_: The path to search.
@@ -598,13 +600,14 @@ class Client(metaclass=ClientMetaClass):
                 Absolute path to a ZenML repository directory or None if no
                 repository directory was found.
             """
-            if Client.is_repository_directory(path_):
-                return path_
+            while not Client.is_repository_directory(path_):
+                if not search_parent_directories or io_utils.is_root(
+                    str(path_)
+                ):
+                    return None
+                path_ = path_.parent
 
-            if not search_parent_directories or io_utils.is_root(str(path_)):
-                return None
-
-            return _find_repository_helper(path_.parent)
+            return path_
 
         repository_path = _find_repository_helper(path)
 
@@ -1073,6 +1076,7 @@ class Client(metaclass=ClientMetaClass):
         workspace_update = WorkspaceUpdate(name=new_name or workspace.name)
         if new_description:
             workspace_update.description = new_description
+        self._workspace_cache.clear()
         return self.zen_store.update_workspace(
             workspace_id=workspace.id,
             workspace_update=workspace_update,
@@ -1097,6 +1101,7 @@ class Client(metaclass=ClientMetaClass):
                 "it is currently active. Please set another workspace as "
                 "active first."
             )
+        self._workspace_cache.clear()
         self.zen_store.delete_workspace(workspace_name_or_id=workspace.id)
 
     @property
@@ -1114,7 +1119,13 @@ class Client(metaclass=ClientMetaClass):
         """
         if ENV_ZENML_ACTIVE_WORKSPACE_ID in os.environ:
             workspace_id = os.environ[ENV_ZENML_ACTIVE_WORKSPACE_ID]
-            return self.get_workspace(workspace_id)
+            # This property is accessed by almost every client method, so we
+            # only fetch the workspace once instead of on every access
+            if workspace_id not in self._workspace_cache:
+                self._workspace_cache[workspace_id] = self.get_workspace(
+                    workspace_id
+                )
+            return self._workspace_cache[workspace_id]
 
         from zenml.constants import DEFAULT_WORKSPACE_NAME
 
@@ -3588,9 +3599,10 @@ class Client(metaclass=ClientMetaClass):
             unused_artifact_versions = depaginate(
                 partial(self.list_artifact_versions, only_unused=True)
             )
+            artifact_stores: Dict[UUID, "BaseArtifactStore"] = {}
             for unused_artifact_version in unused_artifact_versions:
                 self._delete_artifact_from_artifact_store(
-                    unused_artifact_version
+                    unused_artifact_version, artifact_stores=artifact_stores
                 )
 
         self.zen_store.prune_artifact_versions(only_versions)
@@ -3794,9 +3806,11 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             ValueError: If the artifact version is still used in any runs.
         """
-        if artifact_version not in depaginate(
-            partial(self.list_artifact_versions, only_unused=True)
-        ):
+        # Only check whether this specific version is unused instead of
+        # fetching all unused artifact versions
+        if not self.list_artifact_versions(
+            id=artifact_version.id, only_unused=True, size=1
+        ).total:
             raise ValueError(
                 "The metadata of artifact versions that are used in runs "
                 "cannot be deleted. Please delete all runs that use this "
@@ -3809,12 +3823,18 @@ class Client(metaclass=ClientMetaClass):
         )
 
     def _delete_artifact_from_artifact_store(
-        self, artifact_version: ArtifactVersionResponse
+        self,
+        artifact_version: ArtifactVersionResponse,
+        artifact_stores: Optional[Dict[UUID, "BaseArtifactStore"]] = None,
     ) -> None:
         """Delete an artifact object from the artifact store.
 
         Args:
             artifact_version: The artifact version to delete.
+            artifact_stores: Artifact store instances by ID. Callers deleting
+                multiple artifact versions can pass the same dictionary to
+                each call, so that every artifact store is only fetched and
+                instantiated once.
 
         Raises:
             Exception: If the artifact store is inaccessible.
@@ -3829,14 +3849,21 @@ class Client(metaclass=ClientMetaClass):
                 "store."
             )
             return
+        if artifact_stores is None:
+            artifact_stores = {}
+        artifact_store_id = artifact_version.artifact_store_id
         try:
-            artifact_store_model = self.get_stack_component(
-                component_type=StackComponentType.ARTIFACT_STORE,
-                name_id_or_prefix=artifact_version.artifact_store_id,
-            )
-            artifact_store = StackComponent.from_model(artifact_store_model)
-            assert isinstance(artifact_store, BaseArtifactStore)
-            artifact_store.rmtree(artifact_version.uri)
+            if artifact_store_id not in artifact_stores:
+                artifact_store_model = self.get_stack_component(
+                    component_type=StackComponentType.ARTIFACT_STORE,
+                    name_id_or_prefix=artifact_store_id,
+                )
+                artifact_store = StackComponent.from_model(
+                    artifact_store_model
+                )
+                assert isinstance(artifact_store, BaseArtifactStore)
+                artifact_stores[artifact_store_id] = artifact_store
+            artifact_stores[artifact_store_id].rmtree(artifact_version.uri)
         except Exception as e:
             logger.error(
                 f"Failed to delete artifact '{artifact_version.uri}' from the "
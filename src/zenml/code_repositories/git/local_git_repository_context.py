@@ -13,7 +13,7 @@
 #  permissions and limitations under the License.
 """Implementation of the Local git repository context."""
 
-from typing import TYPE_CHECKING, Callable, Optional, cast
+from typing import TYPE_CHECKING, Callable, Optional, Set, cast
 from uuid import UUID
 
 from zenml.code_repositories import (
@@ -45,6 +45,10 @@ class LocalGitRepositoryContext(LocalRepositoryContext):
         super().__init__(code_repository_id=code_repository_id)
         self._git_repo = git_repo
         self._remote = git_repo.remote(name=remote_name)
+        # Local commits which we already found to be pushed to the remote.
+        # Used to avoid fetching from the remote every time we check for
+        # local changes.
+        self._pushed_commits: Set[str] = set()
 
     @classmethod
     def at(
@@ -148,8 +152,6 @@ class LocalGitRepositoryContext(LocalRepositoryContext):
         if self.is_dirty:
             return True
 
-        self.remote.fetch()
-
         local_commit_object = self.git_repo.head.commit
         try:
             active_branch = self.git_repo.active_branch
@@ -158,13 +160,22 @@ class LocalGitRepositoryContext(LocalRepositoryContext):
                 "Git repo in detached head state is not allowed."
             )
 
+        if local_commit_object.hexsha in self._pushed_commits:
+            return False
+
+        self.remote.fetch()
+
         try:
             remote_commit_object = self.remote.refs[active_branch.name].commit
         except IndexError:
             # Branch doesn't exist on remote
             return True
 
-        return cast("Commit", remote_commit_object) != local_commit_object
+        if cast("Commit", remote_commit_object) != local_commit_object:
+            return True
+
+        self._pushed_commits.add(local_commit_object.hexsha)
+        return False
 
     @property
     def current_commit(self) -> str:
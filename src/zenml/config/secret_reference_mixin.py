@@ -144,8 +144,10 @@ class SecretReferenceMixin(BaseModel):
         Returns:
             The required secrets of this object.
         """
+        # Secret references can only be top-level attribute values, so we
+        # check the raw field values instead of serializing the whole model
         return {
             secret_utils.parse_secret_reference(v)
-            for v in self.dict().values()
+            for v in self.__dict__.values()
             if secret_utils.is_secret_reference(v)
         }
@@ -52,6 +52,9 @@ class HFDatasetMaterializer(BaseMaterializer):
         Returns:
             The dataset read from the specified dir.
         """
+        # Always load from a copy: datasets writes the cache files of
+        # `map`/`filter` next to the loaded arrow files, which must not end up
+        # in the artifact store
         temp_dir = mkdtemp()
         io_utils.copy_dir(
             os.path.join(self.uri, DEFAULT_DATASET_DIR),
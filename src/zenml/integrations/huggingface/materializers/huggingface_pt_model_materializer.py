@@ -46,17 +46,15 @@ class HFPTModelMaterializer(BaseMaterializer):
         Returns:
             The model read from the specified dir.
         """
-        temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_PT_MODEL_DIR), temp_dir.name
-        )
+        model_dir = os.path.join(self.uri, DEFAULT_PT_MODEL_DIR)
+        if io_utils.is_local_path(self.uri):
+            # No need to copy the model files if they're already available
+            # on the local filesystem
+            return self._load_from_dir(model_dir)
 
-        config = AutoConfig.from_pretrained(temp_dir.name)
-        architecture = config.architectures[0]
-        model_cls = getattr(
-            importlib.import_module("transformers"), architecture
-        )
-        return model_cls.from_pretrained(temp_dir.name)
+        with TemporaryDirectory() as temp_dir:
+            io_utils.copy_dir(model_dir, temp_dir)
+            return self._load_from_dir(temp_dir)
 
     def save(self, model: PreTrainedModel) -> None:
         """Writes a Model to the specified dir.
@@ -64,12 +62,31 @@ class HFPTModelMaterializer(BaseMaterializer):
         Args:
             model: The Torch Model to write.
         """
-        temp_dir = TemporaryDirectory()
-        model.save_pretrained(temp_dir.name)
-        io_utils.copy_dir(
-            temp_dir.name,
-            os.path.join(self.uri, DEFAULT_PT_MODEL_DIR),
+        model_dir = os.path.join(self.uri, DEFAULT_PT_MODEL_DIR)
+        if io_utils.is_local_path(self.uri):
+            model.save_pretrained(model_dir)
+            return
+
+        with TemporaryDirectory() as temp_dir:
+            model.save_pretrained(temp_dir)
+            io_utils.copy_dir(temp_dir, model_dir)
+
+    @staticmethod
+    def _load_from_dir(model_dir: str) -> PreTrainedModel:
+        """Loads a model from a local directory.
+
+        Args:
+            model_dir: The local directory containing the model files.
+
+        Returns:
+            The loaded model.
+        """
+        config = AutoConfig.from_pretrained(model_dir)
+        architecture = config.architectures[0]
+        model_cls = getattr(
+            importlib.import_module("transformers"), architecture
         )
+        return model_cls.from_pretrained(model_dir)
 
     def extract_metadata(
         self, model: PreTrainedModel
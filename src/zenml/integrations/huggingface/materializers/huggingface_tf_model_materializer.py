@@ -46,17 +46,13 @@ class HFTFModelMaterializer(BaseMaterializer):
         Returns:
             The model read from the specified dir.
         """
-        temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_TF_MODEL_DIR), temp_dir.name
-        )
+        model_dir = os.path.join(self.uri, DEFAULT_TF_MODEL_DIR)
+        if io_utils.is_local_path(self.uri):
+            return self._load_from_dir(model_dir)
 
-        config = AutoConfig.from_pretrained(temp_dir.name)
-        architecture = "TF" + config.architectures[0]
-        model_cls = getattr(
-            importlib.import_module("transformers"), architecture
-        )
-        return model_cls.from_pretrained(temp_dir.name)
+        with TemporaryDirectory() as temp_dir:
+            io_utils.copy_dir(model_dir, temp_dir)
+            return self._load_from_dir(temp_dir)
 
     def save(self, model: TFPreTrainedModel) -> None:
         """Writes a Model to the specified dir.
@@ -71,6 +67,23 @@ class HFTFModelMaterializer(BaseMaterializer):
             os.path.join(self.uri, DEFAULT_TF_MODEL_DIR),
         )
 
+    @staticmethod
+    def _load_from_dir(model_dir: str) -> TFPreTrainedModel:
+        """Loads a model from a local directory.
+
+        Args:
+            model_dir: The local directory containing the model files.
+
+        Returns:
+            The loaded model.
+        """
+        config = AutoConfig.from_pretrained(model_dir)
+        architecture = "TF" + config.architectures[0]
+        model_cls = getattr(
+            importlib.import_module("transformers"), architecture
+        )
+        return model_cls.from_pretrained(model_dir)
+
     def extract_metadata(
         self, model: TFPreTrainedModel
     ) -> Dict[str, "MetadataType"]:
@@ -46,12 +46,13 @@ class HFTokenizerMaterializer(BaseMaterializer):
         Returns:
             The tokenizer read from the specified dir.
         """
-        temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_TOKENIZER_DIR), temp_dir.name
-        )
+        tokenizer_dir = os.path.join(self.uri, DEFAULT_TOKENIZER_DIR)
+        if io_utils.is_local_path(self.uri):
+            return AutoTokenizer.from_pretrained(tokenizer_dir)
 
-        return AutoTokenizer.from_pretrained(temp_dir.name)
+        with TemporaryDirectory() as temp_dir:
+            io_utils.copy_dir(tokenizer_dir, temp_dir)
+            return AutoTokenizer.from_pretrained(temp_dir)
 
     def save(self, tokenizer: Type[Any]) -> None:
         """Writes a Tokenizer to the specified dir.
@@ -39,11 +39,17 @@ class PyTorchModuleMaterializer(BasePyTorchMaterializer):
 
     Inspired by the guide:
     https://pytorch.org/tutorials/beginner/saving_loading_models.html
+
+    Besides the entire model, the materializer also stores the model
+    `state_dict` as a separate checkpoint file. For large models, this doubles
+    the amount of data that is written, so subclasses can set
+    `SAVE_CHECKPOINT` to `False` to only store the entire model.
     """
 
     ASSOCIATED_TYPES: ClassVar[Tuple[Type[Any], ...]] = (Module,)
     ASSOCIATED_ARTIFACT_TYPE: ClassVar[ArtifactType] = ArtifactType.MODEL
     FILENAME: ClassVar[str] = DEFAULT_FILENAME
+    SAVE_CHECKPOINT: ClassVar[bool] = True
 
     def save(self, model: Module) -> None:
         """Writes a PyTorch model, as a model and a checkpoint.
@@ -57,7 +63,7 @@ class PyTorchModuleMaterializer(BasePyTorchMaterializer):
 
         # Also save model checkpoint to artifact directory,
         # This is the default behavior for loading model in production phase (inference)
-        if isinstance(model, Module):
+        if self.SAVE_CHECKPOINT and isinstance(model, Module):
             with fileio.open(
                 os.path.join(self.uri, CHECKPOINT_FILENAME), "wb"
             ) as f:
@@ -27,10 +27,13 @@ def count_module_params(module: torch.nn.Module) -> Dict[str, int]:
     Returns:
         A dictionary with the total and trainable parameters.
     """
-    total_params = sum([param.numel() for param in module.parameters()])
-    trainable_params = sum(
-        [param.numel() for param in module.parameters() if param.requires_grad]
-    )
+    total_params = 0
+    trainable_params = 0
+    for param in module.parameters():
+        num_params = param.numel()
+        total_params += num_params
+        if param.requires_grad:
+            trainable_params += num_params
     return {
         "num_params": total_params,
         "num_trainable_params": trainable_params,
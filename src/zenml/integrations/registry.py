@@ -85,7 +85,7 @@ class IntegrationRegistry(object):
         Returns:
             A list of all possible integrations.
         """
-        return [name for name in self._integrations]
+        return list(self._integrations)
 
     def select_integration_requirements(
         self,
@@ -105,7 +105,7 @@ class IntegrationRegistry(object):
             KeyError: If the integration is not found.
         """
         if integration_name:
-            if integration_name in self.list_integration_names:
+            if integration_name in self._integrations:
                 return self._integrations[integration_name].get_requirements(
                     target_os=target_os
                 )
@@ -118,8 +118,8 @@ class IntegrationRegistry(object):
         else:
             return [
                 requirement
-                for name in self.list_integration_names
-                for requirement in self._integrations[name].get_requirements(
+                for integration in self._integrations.values()
+                for requirement in integration.get_requirements(
                     target_os=target_os
                 )
             ]
@@ -136,14 +136,13 @@ class IntegrationRegistry(object):
         Raises:
             KeyError: If the integration is not found.
         """
-        if integration_name in self.list_integration_names:
+        if integration_name in self._integrations:
             return self._integrations[integration_name].check_installation()
         elif not integration_name:
-            all_installed = [
-                self._integrations[item].check_installation()
-                for item in self.list_integration_names
-            ]
-            return all(all_installed)
+            return all(
+                integration.check_installation()
+                for integration in self._integrations.values()
+            )
         else:
             raise KeyError(
                 f"Integration '{integration_name}' not found. "
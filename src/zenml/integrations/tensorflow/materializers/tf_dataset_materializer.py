@@ -45,6 +45,13 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
         Returns:
             A tf.data.Dataset object.
         """
+        if io_utils.is_local_path(self.uri):
+            # The dataset is read lazily, so it can stream the elements
+            # directly from the artifact store without copying it first
+            return tf.data.experimental.load(
+                os.path.join(self.uri, DEFAULT_FILENAME)
+            )
+
         temp_dir = tempfile.mkdtemp()
         io_utils.copy_dir(self.uri, temp_dir)
         path = os.path.join(temp_dir, DEFAULT_FILENAME)
@@ -13,7 +13,16 @@
 #  permissions and limitations under the License.
 """Class for lineage graph generation."""
 
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from pydantic import BaseModel
 
@@ -129,12 +138,23 @@ class LineageGraph(BaseModel):
         Args:
             run: The pipeline run to add direct edges for.
         """
+        # Index the edges once instead of scanning all edges for every
+        # (step, parent step) pair
+        node_outputs, node_inputs = self._get_edge_index()
+
         for step in run.steps.values():
             step_id = STEP_PREFIX + str(step.id)
             for parent_step_id_uuid in step.parent_step_ids:
                 parent_step_id = STEP_PREFIX + str(parent_step_id_uuid)
-                if not self.has_artifact_link(step_id, parent_step_id):
+                if not self._has_artifact_link(
+                    step_id=step_id,
+                    parent_step_id=parent_step_id,
+                    node_outputs=node_outputs,
+                    node_inputs=node_inputs,
+                ):
                     self.add_edge(parent_step_id, step_id)
+                    node_outputs[parent_step_id].add(step_id)
+                    node_inputs[step_id].add(parent_step_id)
 
     def has_artifact_link(self, step_id: str, parent_step_id: str) -> bool:
         """Checks if a step has an artifact link to a parent step.
@@ -149,13 +169,51 @@ class LineageGraph(BaseModel):
         Returns:
             True if the steps are linked via an artifact, False otherwise.
         """
-        parent_outputs, child_inputs = set(), set()
+        node_outputs, node_inputs = self._get_edge_index()
+        return self._has_artifact_link(
+            step_id=step_id,
+            parent_step_id=parent_step_id,
+            node_outputs=node_outputs,
+            node_inputs=node_inputs,
+        )
+
+    def _get_edge_index(
+        self,
+    ) -> Tuple[DefaultDict[str, Set[str]], DefaultDict[str, Set[str]]]:
+        """Indexes the edges of the lineage graph by source and target.
+
+        Returns:
+            The targets of all edges by source node ID and the sources of all
+            edges by target node ID.
+        """
+        node_outputs: DefaultDict[str, Set[str]] = defaultdict(set)
+        node_inputs: DefaultDict[str, Set[str]] = defaultdict(set)
         for edge in self.edges:
-            if edge.source == parent_step_id:
-                parent_outputs.add(edge.target)
-            if edge.target == step_id:
-                child_inputs.add(edge.source)
-        return bool(parent_outputs.intersection(child_inputs))
+            node_outputs[edge.source].add(edge.target)
+            node_inputs[edge.target].add(edge.source)
+        return node_outputs, node_inputs
+
+    @staticmethod
+    def _has_artifact_link(
+        step_id: str,
+        parent_step_id: str,
+        node_outputs: DefaultDict[str, Set[str]],
+        node_inputs: DefaultDict[str, Set[str]],
+    ) -> bool:
+        """Checks if a step has an artifact link to a parent step.
+
+        Args:
+            step_id: The node ID of the step to check.
+            parent_step_id: The node ID of the parent step to check.
+            node_outputs: The targets of all edges by source node ID.
+            node_inputs: The sources of all edges by target node ID.
+
+        Returns:
+            True if the steps are linked via an artifact, False otherwise.
+        """
+        return not node_outputs[parent_step_id].isdisjoint(
+            node_inputs[step_id]
+        )
 
     def add_step_node(
         self,
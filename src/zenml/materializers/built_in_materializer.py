@@ -292,17 +292,20 @@ class BuiltInContainerMaterializer(BaseMaterializer):
         Raises:
             RuntimeError: If the data was not found.
         """
+        # Existence checks can be remote calls, so only check the data path once
+        data_exists = self.artifact_store.exists(self.data_path)
+
         # If the data was not serialized, there must be metadata present.
-        if not self.artifact_store.exists(
-            self.data_path
-        ) and not self.artifact_store.exists(self.metadata_path):
+        if not data_exists and not self.artifact_store.exists(
+            self.metadata_path
+        ):
             raise RuntimeError(
                 f"Materialization of type {data_type} failed. Expected either"
                 f"{self.data_path} or {self.metadata_path} to exist."
             )
 
         # If the data was serialized as JSON, deserialize it.
-        if self.artifact_store.exists(self.data_path):
+        if data_exists:
             outputs = yaml_utils.read_json(self.data_path)
 
         # Otherwise, use the metadata to reconstruct the data as a list.
@@ -32,6 +32,7 @@ from zenml.exceptions import EntityExistsError
 from zenml.logger import get_logger
 
 if TYPE_CHECKING:
+    from zenml.artifact_stores.base_artifact_store import BaseArtifactStore
     from zenml.metadata.metadata_types import MetadataType
     from zenml.models import (
         ArtifactVersionResponse,
@@ -414,10 +415,12 @@ class Model(BaseModel):
             artifact_responses.update(mv.model_artifacts)
             artifact_responses.update(mv.deployment_artifacts)
 
+            artifact_stores: Dict[UUID, "BaseArtifactStore"] = {}
             for artifact_ in artifact_responses.values():
                 for artifact_response_ in artifact_.values():
                     client._delete_artifact_from_artifact_store(
-                        artifact_version=artifact_response_
+                        artifact_version=artifact_response_,
+                        artifact_stores=artifact_stores,
                     )
 
         client.delete_all_model_version_artifact_links(self.id, only_link)
@@ -622,9 +625,19 @@ class Model(BaseModel):
         from zenml.client import Client
         from zenml.models import ModelVersionRequest
 
+        zenml_client = Client()
+        if self._id is not None:
+            # The model version was already resolved before, so we fetch it
+            # by ID instead of resolving the model and version names again
+            model_version = zenml_client.zen_store.get_model_version(
+                model_version_id=self._id
+            )
+            self._model_id = model_version.model.id
+            self._number = model_version.number
+            return model_version
+
         model = self._get_or_create_model()
 
-        zenml_client = Client()
         model_version_request = ModelVersionRequest(
             user=zenml_client.active_user.id,
             workspace=zenml_client.active_workspace.id,
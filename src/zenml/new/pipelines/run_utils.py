@@ -155,6 +155,7 @@ def _update_new_requesters(
     model: "Model",
     new_versions_requested: Dict[Tuple[str, Optional[str]], NewModelRequest],
     other_models: Set["Model"],
+    existing_versions: Dict[Tuple[str, Optional[str]], bool],
 ) -> None:
     key = (
         model.name,
@@ -163,11 +164,17 @@ def _update_new_requesters(
     if model.version is None:
         version_existed = False
     else:
-        try:
-            model._get_model_version()
-            version_existed = key not in new_versions_requested
-        except KeyError:
-            version_existed = False
+        # Steps often share the same model version, so we only look up each
+        # model version once instead of once per step
+        if key not in existing_versions:
+            try:
+                model._get_model_version()
+                existing_versions[key] = True
+            except KeyError:
+                existing_versions[key] = False
+        version_existed = (
+            existing_versions[key] and key not in new_versions_requested
+        )
     if not version_existed:
         model.was_created_in_this_run = True
         new_versions_requested[key].update_request(
@@ -190,6 +197,7 @@ def prepare_model_versions(
         Tuple[str, Optional[str]], NewModelRequest
     ] = defaultdict(NewModelRequest)
     other_models: Set["Model"] = set()
+    existing_versions: Dict[Tuple[str, Optional[str]], bool] = {}
     all_steps_have_own_config = True
     for step in deployment.step_configurations.values():
         step_model = step.config.model
@@ -202,6 +210,7 @@ def prepare_model_versions(
                 requester_name=step.config.name,
                 new_versions_requested=new_versions_requested,
                 other_models=other_models,
+                existing_versions=existing_versions,
             )
     if not all_steps_have_own_config:
         pipeline_model = deployment.pipeline_configuration.model
@@ -211,6 +220,7 @@ def prepare_model_versions(
                 requester_name=deployment.pipeline_configuration.name,
                 new_versions_requested=new_versions_requested,
                 other_models=other_models,
+                existing_versions=existing_versions,
             )
     elif deployment.pipeline_configuration.model is not None:
         logger.warning(
@@ -673,8 +673,6 @@ class StepRunner:
                             model_version_response.id,
                         )
                     )
-                else:
-                    break
         return models
 
     def _get_model_versions_from_config(self) -> Set[Tuple[UUID, UUID]]:
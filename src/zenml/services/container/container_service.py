@@ -19,6 +19,7 @@ import sys
 import tempfile
 import time
 from abc import abstractmethod
+from collections import deque
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
 import docker.errors as docker_errors
@@ -506,9 +507,8 @@ class ContainerService(BaseService):
 
         with open(self.status.log_file, "r") as f:
             if tail:
-                # TODO[ENG-864]: implement a more efficient tailing mechanism that
-                #   doesn't read the entire file
-                lines = f.readlines()[-tail:]
+                # Only keep the last `tail` lines in memory while reading
+                lines = deque(f, maxlen=tail)
                 for line in lines:
                     yield line.rstrip("\n")
                 if not follow:
@@ -116,7 +116,7 @@ class StackComponentConfig(BaseModel, ABC):
         """
         return {
             secret_utils.parse_secret_reference(v)
-            for v in self.dict().values()
+            for v in self.__dict__.values()
             if secret_utils.is_secret_reference(v)
         }
 
@@ -97,12 +97,16 @@ class FileSyncModel(BaseModel):
 
     def load_config(self) -> None:
         """Loads the model from the configuration file on disk."""
-        if not fileio.exists(self._config_file):
+        # This is called on every attribute access, so we use a single stat
+        # call to check both the existence and the modification time of the
+        # configuration file
+        try:
+            file_timestamp = os.path.getmtime(self._config_file)
+        except FileNotFoundError:
             return
 
         # don't reload the configuration if the file hasn't
         # been updated since the last load
-        file_timestamp = os.path.getmtime(self._config_file)
         if file_timestamp == self._config_file_timestamp:
             return
 
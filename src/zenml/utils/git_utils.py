@@ -14,10 +14,10 @@
 """Utility function to clone a Git repository."""
 
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from git import GitCommandError
-from git.repo import Repo
+if TYPE_CHECKING:
+    from git.repo.base import Repo
 
 
 def clone_git_repository(
@@ -25,7 +25,8 @@ def clone_git_repository(
     to_path: str,
     branch: Optional[str] = None,
     commit: Optional[str] = None,
-) -> Repo:
+    depth: Optional[int] = None,
+) -> "Repo":
     """Clone a Git repository.
 
     Args:
@@ -34,6 +35,9 @@ def clone_git_repository(
         branch: Branch to clone. Defaults to "main".
         commit: Commit to checkout. If specified, the branch argument is
             ignored.
+        depth: If specified, create a shallow clone with the history truncated
+            to this number of commits. Only used when cloning a branch, as an
+            arbitrary commit might not be part of a truncated history.
 
     Returns:
         The cloned repository.
@@ -41,6 +45,10 @@ def clone_git_repository(
     Raises:
         RuntimeError: If the repository could not be cloned.
     """
+    # These imports fail when git is not installed on the machine
+    from git.exc import GitCommandError
+    from git.repo.base import Repo
+
     os.makedirs(os.path.basename(to_path), exist_ok=True)
     try:
         if commit:
@@ -50,6 +58,14 @@ def clone_git_repository(
                 no_checkout=True,
             )
             repo.git.checkout(commit)
+        elif depth:
+            repo = Repo.clone_from(
+                url=url,
+                to_path=to_path,
+                branch=branch or "main",
+                depth=depth,
+                single_branch=True,
+            )
         else:
             repo = Repo.clone_from(
                 url=url,
@@ -15,8 +15,10 @@
 
 import fnmatch
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, List, Tuple
 
 import click
 
@@ -37,6 +39,12 @@ from zenml.io.fileio import (
 if TYPE_CHECKING:
     from zenml.io.filesystem import PathType
 
+COPY_DIR_MAX_WORKERS = 8
+
+# Tuple version of the remote prefixes so that `str.startswith` can check all
+# of them in a single call
+_REMOTE_FS_PREFIXES = tuple(REMOTE_FS_PREFIX)
+
 
 def is_root(path: str) -> bool:
     """Returns true if path has no parent in local filesystem.
@@ -101,11 +109,45 @@ def copy_dir(
 ) -> None:
     """Copies dir from source to destination.
 
+    The directory tree is traversed first, after which the individual files
+    are copied concurrently.
+
     Args:
         source_dir: Path to copy from.
         destination_dir: Path to copy to.
         overwrite: Boolean. If false, function throws an error before overwrite.
     """
+    files_to_copy = _get_files_to_copy(source_dir, destination_dir)
+    if not files_to_copy:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(COPY_DIR_MAX_WORKERS, len(files_to_copy))
+    ) as executor:
+        futures = [
+            executor.submit(copy, source_path, destination_path, overwrite)
+            for source_path, destination_path in files_to_copy
+        ]
+        for future in futures:
+            future.result()
+
+
+def _get_files_to_copy(
+    source_dir: str, destination_dir: str
+) -> List[Tuple[str, str]]:
+    """Gets all files to copy from a source to a destination directory.
+
+    All destination directories which will contain files are created.
+
+    Args:
+        source_dir: Path to copy from.
+        destination_dir: Path to copy to.
+
+    Returns:
+        List of source and destination paths of all files to copy.
+    """
+    files_to_copy: List[Tuple[str, str]] = []
+    destination_dir_created = False
     for source_file in listdir(source_dir):
         source_path = os.path.join(source_dir, convert_to_str(source_file))
         destination_path = os.path.join(
@@ -116,12 +158,15 @@ def copy_dir(
                 # if the destination is a subdirectory of the source, we skip
                 # copying it to avoid an infinite loop.
                 continue
-            copy_dir(source_path, destination_path, overwrite)
-        else:
-            create_dir_recursive_if_not_exists(
-                os.path.dirname(destination_path)
+            files_to_copy.extend(
+                _get_files_to_copy(source_path, destination_path)
             )
-            copy(str(source_path), str(destination_path), overwrite)
+        else:
+            if not destination_dir_created:
+                create_dir_recursive_if_not_exists(destination_dir)
+                destination_dir_created = True
+            files_to_copy.append((source_path, destination_path))
+    return files_to_copy
 
 
 def find_files(dir_path: "PathType", pattern: str) -> Iterable[str]:
@@ -152,7 +197,22 @@ def is_remote(path: str) -> bool:
     Returns:
         True if remote path, else False.
     """
-    return any(path.startswith(prefix) for prefix in REMOTE_FS_PREFIX)
+    return path.startswith(_REMOTE_FS_PREFIXES)
+
+
+def is_local_path(path: str) -> bool:
+    """Returns True if path refers to the local filesystem.
+
+    Unlike `is_remote`, this also considers paths of filesystems registered by
+    custom artifact stores as non-local.
+
+    Args:
+        path: Any path as a string.
+
+    Returns:
+        True if the path has no filesystem scheme, else False.
+    """
+    return re.match(r"^[a-z0-9]+://", path) is None
 
 
 def create_file_if_not_exists(
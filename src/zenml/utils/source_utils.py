@@ -20,6 +20,7 @@ import os
 import site
 import sys
 from distutils.sysconfig import get_python_lib
+from functools import lru_cache
 from pathlib import Path, PurePath
 from types import ModuleType
 from typing import (
@@ -27,6 +28,7 @@ from typing import (
     Callable,
     Iterator,
     Optional,
+    Tuple,
     Type,
     Union,
     cast,
@@ -265,7 +267,7 @@ def is_internal_module(module_name: str) -> bool:
     Returns:
         True if the module is internal, False otherwise.
     """
-    return module_name.split(".", maxsplit=1)[0] == "zenml"
+    return module_name.partition(".")[0] == "zenml"
 
 
 def is_user_file(file_path: str) -> bool:
@@ -281,6 +283,34 @@ def is_user_file(file_path: str) -> bool:
     return Path(source_root) in Path(file_path).resolve().parents
 
 
+@lru_cache(maxsize=1)
+def _get_standard_lib_root() -> Path:
+    """Get the resolved root directory of the Python standard library.
+
+    Returns:
+        The standard library root.
+    """
+    stdlib_root = get_python_lib(standard_lib=True)
+    logger.debug("Standard library root: %s", stdlib_root)
+    return Path(stdlib_root).resolve()
+
+
+@lru_cache(maxsize=1)
+def _get_site_packages_roots() -> Tuple[Path, ...]:
+    """Get the resolved site-packages directories.
+
+    Resolving these paths requires file system access, so they're computed
+    only once instead of for every module whose source type gets checked.
+
+    Returns:
+        The site-packages directories.
+    """
+    return tuple(
+        Path(path).resolve()
+        for path in site.getsitepackages() + [site.getusersitepackages()]
+    )
+
+
 def is_standard_lib_file(file_path: str) -> bool:
     """Checks if a file belongs to the Python standard library.
 
@@ -291,9 +321,7 @@ def is_standard_lib_file(file_path: str) -> bool:
         True if the file belongs to the Python standard library, False
         otherwise.
     """
-    stdlib_root = get_python_lib(standard_lib=True)
-    logger.debug("Standard library root: %s", stdlib_root)
-    return Path(stdlib_root).resolve() in Path(file_path).resolve().parents
+    return _get_standard_lib_root() in Path(file_path).resolve().parents
 
 
 def is_distribution_package_file(file_path: str, module_name: str) -> bool:
@@ -309,8 +337,8 @@ def is_distribution_package_file(file_path: str, module_name: str) -> bool:
     """
     absolute_file_path = Path(file_path).resolve()
 
-    for path in site.getsitepackages() + [site.getusersitepackages()]:
-        if Path(path).resolve() in absolute_file_path.parents:
+    for path in _get_site_packages_roots():
+        if path in absolute_file_path.parents:
             return True
 
     # TODO: The previous check does not detect editable installs because
@@ -515,7 +543,7 @@ def _get_package_for_module(module_name: str) -> Optional[str]:
     else:
         from importlib.metadata import packages_distributions
 
-    top_level_module = module_name.split(".", maxsplit=1)[0]
+    top_level_module = module_name.partition(".")[0]
     package_names = packages_distributions().get(top_level_module, [])
 
     if len(package_names) == 1:
@@ -93,7 +93,7 @@ def dehydrate_response_model(
     if not server_config().rbac_enabled:
         return model
 
-    if not permissions:
+    if permissions is None:
         auth_context = get_auth_context()
         assert auth_context
 
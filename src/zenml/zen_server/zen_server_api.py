@@ -22,7 +22,6 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from genericpath import isfile
 from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import FileResponse
 
@@ -309,12 +308,13 @@ def get_root_static_files() -> List[str]:
     if not os.path.isdir(root_path):
         return []
     files = []
-    for file in os.listdir(root_path):
-        if file == "index.html":
-            # this is served separately
-            continue
-        if isfile(os.path.join(root_path, file)):
-            files.append(file)
+    with os.scandir(root_path) as entries:
+        for entry in entries:
+            if entry.name == "index.html":
+                # this is served separately
+                continue
+            if entry.is_file():
+                files.append(entry.name)
     return files
 
 
@@ -131,9 +131,15 @@ class MigrationUtils(BaseModel):
         """
         database = database or self.url.database
 
-        engine = self.create_engine(database=database)
+        # Reuse the cached, pooled engine for the primary database instead of
+        # building a new engine (and connection pool) for every check
+        if database == self.url.database:
+            engine = self.engine
+        else:
+            engine = self.create_engine(database=database)
         try:
-            engine.connect()
+            with engine.connect():
+                pass
         except OperationalError as e:
             if self.is_mysql_missing_database_error(e):
                 return False
@@ -144,6 +150,9 @@ class MigrationUtils(BaseModel):
                 raise
         else:
             return True
+        finally:
+            if engine is not self._engine:
+                engine.dispose()
 
     def drop_database(
         self,
@@ -680,6 +689,7 @@ class MigrationUtils(BaseModel):
         backup_engine = self.create_engine(database=backup_db_name)
 
         self._copy_database(self.engine, backup_engine)
+        backup_engine.dispose()
 
         logger.debug(
             f"Database backed up to the `{backup_db_name}` backup database."
@@ -707,6 +717,7 @@ class MigrationUtils(BaseModel):
         )
 
         self._copy_database(backup_engine, self.engine)
+        backup_engine.dispose()
 
         logger.debug(
             f"Database restored from the `{backup_db_name}` "
@@ -13,8 +13,10 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of pipeline deployment tables."""
 
+import copy
 import json
-from typing import TYPE_CHECKING, Any, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
@@ -48,6 +50,20 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 
 
+@lru_cache(maxsize=32)
+def _load_step_configurations(step_configurations: str) -> Dict[str, Any]:
+    """Decode the JSON step configurations of a deployment.
+
+    Args:
+        step_configurations: The JSON-encoded step configurations.
+
+    Returns:
+        The decoded step configurations. The dictionary is shared between
+        callers and must not be modified.
+    """
+    return cast(Dict[str, Any], json.loads(step_configurations))
+
+
 class PipelineDeploymentSchema(BaseSchema, table=True):
     """SQL Model for pipeline deployments."""
 
@@ -189,6 +205,23 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             server_version=request.server_version,
         )
 
+    def get_step_configuration(self, step_name: str) -> Step:
+        """Get the configuration of a single step of this deployment.
+
+        The decoded step configurations are cached, so converting all step
+        runs of a deployment only decodes its configurations once.
+
+        Args:
+            step_name: The name of the step.
+
+        Returns:
+            The step configuration.
+        """
+        step_configurations = _load_step_configurations(
+            self.step_configurations
+        )
+        return Step.parse_obj(copy.deepcopy(step_configurations[step_name]))
+
     def to_model(
         self,
         include_metadata: bool = False,
@@ -13,7 +13,6 @@
 #  permissions and limitations under the License.
 """SQLModel implementation of step run tables."""
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional
 from uuid import UUID
@@ -212,8 +211,8 @@ class StepRunSchema(NamedSchema, table=True):
         }
 
         if self.deployment is not None:
-            full_step_config = Step.parse_obj(
-                json.loads(self.deployment.step_configurations)[self.name]
+            full_step_config = self.deployment.get_step_configuration(
+                self.name
             )
         elif self.step_configuration is not None:
             full_step_config = Step.parse_raw(self.step_configuration)
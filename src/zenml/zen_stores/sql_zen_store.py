@@ -42,7 +42,7 @@ from uuid import UUID
 from packaging import version
 from pydantic import Field, SecretStr, root_validator, validator
 from pydantic.json import pydantic_encoder
-from sqlalchemy import asc, desc, func
+from sqlalchemy import asc, desc, event, func
 from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import (
     ArgumentError,
@@ -55,7 +55,6 @@ from sqlmodel import (
     SQLModel,
     and_,
     col,
-    create_engine,
     delete,
     or_,
     select,
@@ -339,6 +338,9 @@ Select.inherit_cache = True
 logger = get_logger(__name__)
 
 ZENML_SQLITE_DB_FILENAME = "zenml.db"
+# Size of the SQLite page cache per connection, in KiB (the SQLite default
+# is only ~2 MiB)
+ZENML_SQLITE_CACHE_SIZE_KIB = 32768
 
 
 class SQLDatabaseDriver(StrEnum):
@@ -1017,19 +1019,36 @@ class SqlZenStore(BaseZenStore):
     # Initialization and configuration
     # --------------------------------
 
+    @staticmethod
+    def _configure_sqlite(
+        dbapi_connection: Any, connection_record: Any
+    ) -> None:
+        """Configure a new SQLite database connection.
+
+        Args:
+            dbapi_connection: The DBAPI connection.
+            connection_record: The connection record.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA cache_size = -{ZENML_SQLITE_CACHE_SIZE_KIB}")
+        cursor.execute("PRAGMA temp_store = MEMORY")
+        cursor.close()
+
     def _initialize(self) -> None:
         """Initialize the SQL store."""
         logger.debug("Initializing SqlZenStore at %s", self.config.url)
 
         url, connect_args, engine_args = self.config.get_sqlalchemy_config()
-        self._engine = create_engine(
-            url=url, connect_args=connect_args, **engine_args
-        )
         self._migration_utils = MigrationUtils(
             url=url,
             connect_args=connect_args,
             engine_args=engine_args,
         )
+        # The store and the migration utilities connect to the same database
+        # and share a single engine and connection pool
+        self._engine = self._migration_utils.engine
+        if self.config.driver == SQLDatabaseDriver.SQLITE:
+            event.listen(self._engine, "connect", self._configure_sqlite)
 
         # SQLite: As long as the parent directory exists, SQLAlchemy will
         # automatically create the database.
@@ -2576,43 +2595,32 @@ class SqlZenStore(BaseZenStore):
             only_versions: Only delete artifact versions, keeping artifacts
         """
         with Session(self.engine) as session:
-            unused_artifact_versions = [
-                a[0]
-                for a in session.execute(
-                    select(ArtifactVersionSchema.id).where(
-                        and_(
-                            col(ArtifactVersionSchema.id).notin_(
-                                select(StepRunOutputArtifactSchema.artifact_id)
-                            ),
-                            col(ArtifactVersionSchema.id).notin_(
-                                select(StepRunInputArtifactSchema.artifact_id)
-                            ),
-                        )
-                    )
-                ).fetchall()
-            ]
+            # The unused rows are selected by subqueries within the delete
+            # statements themselves, so no IDs need to be loaded and sent back
+            # to the database as bound parameters
             session.execute(
-                delete(ArtifactVersionSchema).where(
-                    col(ArtifactVersionSchema.id).in_(
-                        unused_artifact_versions
-                    ),
+                delete(ArtifactVersionSchema)
+                .where(
+                    and_(
+                        col(ArtifactVersionSchema.id).notin_(
+                            select(StepRunOutputArtifactSchema.artifact_id)
+                        ),
+                        col(ArtifactVersionSchema.id).notin_(
+                            select(StepRunInputArtifactSchema.artifact_id)
+                        ),
+                    )
                 )
+                .execution_options(synchronize_session=False)
             )
             if not only_versions:
-                unused_artifacts = [
-                    a[0]
-                    for a in session.execute(
-                        select(ArtifactSchema.id).where(
-                            col(ArtifactSchema.id).notin_(
-                                select(ArtifactVersionSchema.artifact_id)
-                            )
-                        )
-                    ).fetchall()
-                ]
                 session.execute(
-                    delete(ArtifactSchema).where(
-                        col(ArtifactSchema.id).in_(unused_artifacts)
+                    delete(ArtifactSchema)
+                    .where(
+                        col(ArtifactSchema.id).notin_(
+                            select(ArtifactVersionSchema.artifact_id)
+                        )
                     )
+                    .execution_options(synchronize_session=False)
                 )
             session.commit()
 
@@ -7331,17 +7339,24 @@ class SqlZenStore(BaseZenStore):
                 PipelineRunSchema.id == pipeline_run_id
             )
         ).one()
-        step_runs = session.exec(
-            select(StepRunSchema).where(
+        step_run_statuses = session.exec(
+            select(StepRunSchema.status).where(
                 StepRunSchema.pipeline_run_id == pipeline_run_id
             )
         ).all()
 
         # Deployment always exists for pipeline runs of newer versions
         assert pipeline_run.deployment
-        num_steps = len(pipeline_run.deployment.to_model().step_configurations)
+        # We only need the number of steps here, so we count the keys of the
+        # stored step configurations instead of converting and hydrating the
+        # entire deployment
+        num_steps = len(
+            json.loads(pipeline_run.deployment.step_configurations)
+        )
         new_status = get_pipeline_run_status(
-            step_statuses=[step_run.status for step_run in step_runs],
+            step_statuses=[
+                ExecutionStatus(status) for status in step_run_statuses
+            ],
             num_steps=num_steps,
         )
 
@@ -8972,16 +8987,14 @@ class SqlZenStore(BaseZenStore):
                     )
 
             _check()
-            all_versions = session.exec(
-                select(ModelVersionSchema)
-                .where(ModelVersionSchema.model_id == model.id)
-                .order_by(ModelVersionSchema.number.desc())  # type: ignore[attr-defined]
-            ).first()
-
-            model_version_.number = (
-                all_versions.number + 1 if all_versions else 1
+            latest_number = session.scalar(
+                select([func.max(ModelVersionSchema.number)]).where(
+                    ModelVersionSchema.model_id == model.id
+                )
             )
 
+            model_version_.number = (latest_number or 0) + 1
+
             if model_version_.name is None:
                 model_version_.name = str(model_version_.number)
             else:
@@ -9324,20 +9337,19 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             if not only_links:
-                artifact_version_ids = session.execute(
-                    select(
-                        ModelVersionArtifactSchema.artifact_version_id
-                    ).where(
-                        ModelVersionArtifactSchema.model_version_id
-                        == model_version_id
-                    )
-                ).fetchall()
                 session.execute(
-                    delete(ArtifactVersionSchema).where(
+                    delete(ArtifactVersionSchema)
+                    .where(
                         col(ArtifactVersionSchema.id).in_(
-                            [a[0] for a in artifact_version_ids]
+                            select(
+                                ModelVersionArtifactSchema.artifact_version_id
+                            ).where(
+                                ModelVersionArtifactSchema.model_version_id
+                                == model_version_id
+                            )
                         )
-                    ),
+                    )
+                    .execution_options(synchronize_session=False)
                 )
             session.execute(
                 delete(ModelVersionArtifactSchema).where(
@@ -9487,21 +9499,43 @@ class SqlZenStore(BaseZenStore):
             resource_id: The id of the resource.
             resource_type: The type of the resource to create link with.
         """
+        # Fetch all existing tags and links in bulk instead of issuing
+        # separate queries for every tag name
+        with Session(self.engine) as session:
+            tag_ids = {
+                tag.name: tag.id
+                for tag in session.exec(
+                    select(TagSchema).where(col(TagSchema.name).in_(tag_names))
+                ).all()
+            }
+            linked_tag_ids = set(
+                session.exec(
+                    select(TagResourceSchema.tag_id).where(
+                        TagResourceSchema.resource_id == resource_id,
+                        TagResourceSchema.resource_type == resource_type.value,
+                    )
+                ).all()
+            )
+
         for tag_name in tag_names:
-            try:
-                tag = self.get_tag(tag_name)
-            except KeyError:
-                tag = self.create_tag(TagRequest(name=tag_name))
+            if tag_name not in tag_ids:
+                tag_ids[tag_name] = self.create_tag(
+                    TagRequest(name=tag_name)
+                ).id
+            tag_id = tag_ids[tag_name]
+            if tag_id in linked_tag_ids:
+                continue
             try:
                 self.create_tag_resource(
                     TagResourceRequest(
-                        tag_id=tag.id,
+                        tag_id=tag_id,
                         resource_id=resource_id,
                         resource_type=resource_type,
                     )
                 )
             except EntityExistsError:
                 pass
+            linked_tag_ids.add(tag_id)
 
     def _detach_tags_from_resource(
         self,
@@ -9516,16 +9550,19 @@ class SqlZenStore(BaseZenStore):
             resource_id: The id of the resource.
             resource_type: The type of the resource to create link with.
         """
-        for tag_name in tag_names:
-            try:
-                tag = self.get_tag(tag_name)
-                self.delete_tag_resource(
-                    tag_id=tag.id,
-                    resource_id=resource_id,
-                    resource_type=resource_type,
+        with Session(self.engine) as session:
+            tag_resources = session.exec(
+                select(TagResourceSchema)
+                .where(TagResourceSchema.tag_id == TagSchema.id)
+                .where(col(TagSchema.name).in_(tag_names))
+                .where(
+                    TagResourceSchema.resource_id == resource_id,
+                    TagResourceSchema.resource_type == resource_type.value,
                 )
-            except KeyError:
-                pass
+            ).all()
+            for tag_resource in tag_resources:
+                session.delete(tag_resource)
+            session.commit()
 
     @track_decorator(AnalyticsEvent.CREATED_TAG)
     def create_tag(self, tag: TagRequest) -> TagResponse:
@@ -96,6 +96,8 @@ def test_parsing_unknown_component_attributes():
         cli_utils.parse_unknown_component_attributes(["foo"])
     with pytest.raises(AssertionError):
         cli_utils.parse_unknown_component_attributes(["foo=bar=qux"])
+    with pytest.raises(AssertionError):
+        cli_utils.parse_unknown_component_attributes(["---foo"])
 
 
 def test_get_package_information_works():
@@ -190,6 +190,15 @@ class TestModel:
             assert mv_test.id == mv.id
             assert mv_test.model.name == model.name
 
+    def test_model_class_from_model_version_has_number_and_model_id(
+        self, clean_client: "Client"
+    ):
+        """Test number and model id of a model class created from a response."""
+        with ModelContext(clean_client, version="1.0.0") as (model, mv):
+            model_class = mv.to_model_class()
+            assert model_class.number == mv.number
+            assert model_class.model_id == model.id
+
     def test_model_fetch_model_and_version_by_number_not_found(
         self, clean_client: "Client"
     ):
@@ -38,7 +38,10 @@ from zenml import (
 from zenml.client import Client
 from zenml.config.pipeline_spec import PipelineSpec
 from zenml.config.source import Source
-from zenml.constants import PAGE_SIZE_DEFAULT
+from zenml.constants import (
+    ENV_ZENML_ACTIVE_WORKSPACE_ID,
+    PAGE_SIZE_DEFAULT,
+)
 from zenml.enums import (
     MetadataResourceTypes,
     ModelStages,
@@ -247,6 +250,21 @@ def test_activating_a_stack_updates_the_config_file(clean_client):
     assert Client(clean_client.root).active_stack_model.name == stack.name
 
 
+def test_active_workspace_from_environment_is_fetched_once(
+    clean_client, mocker
+):
+    """Tests that the workspace set via environment variable is cached."""
+    workspace_id = str(clean_client.active_workspace.id)
+    mocker.patch.dict(
+        os.environ, {ENV_ZENML_ACTIVE_WORKSPACE_ID: workspace_id}
+    )
+    get_workspace_spy = mocker.spy(clean_client, "get_workspace")
+
+    assert str(clean_client.active_workspace.id) == workspace_id
+    assert str(clean_client.active_workspace.id) == workspace_id
+    assert get_workspace_spy.call_count == 1
+
+
 def test_registering_a_stack(clean_client):
     """Tests that registering a stack works and the stack gets persisted."""
     orch = _create_local_orchestrator(
@@ -12,11 +12,16 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+from tempfile import TemporaryDirectory
+
 import pandas as pd
 from datasets import Dataset
 
 from tests.unit.test_general import _test_materializer
+from zenml.client import Client
 from zenml.integrations.huggingface.materializers.huggingface_datasets_materializer import (
+    DEFAULT_DATASET_DIR,
     HFDatasetMaterializer,
 )
 
@@ -35,3 +40,22 @@ def test_huggingface_datasets_materializer(clean_client):
     data = dataset.data.to_pydict()
     assert "0" in data.keys()
     assert [1, 2, 3] in data.values()
+
+
+def test_huggingface_datasets_materializer_load_does_not_modify_artifact(
+    clean_client,
+):
+    """Tests that processing a loaded dataset doesn't write to the artifact."""
+    dataset = Dataset.from_pandas(pd.DataFrame([1, 2, 3]))
+
+    artifact_store_uri = Client().active_stack.artifact_store.path
+    with TemporaryDirectory(dir=artifact_store_uri) as artifact_uri:
+        materializer = HFDatasetMaterializer(uri=artifact_uri)
+        materializer.save(dataset)
+        dataset_dir = os.path.join(artifact_uri, DEFAULT_DATASET_DIR)
+        stored_files = set(os.listdir(dataset_dir))
+
+        loaded_dataset = materializer.load(Dataset)
+        loaded_dataset.map(lambda row: row)
+
+        assert set(os.listdir(dataset_dir)) == stored_files
@@ -12,10 +12,13 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+
 from torch.nn import Linear
 
 from tests.unit.test_general import _test_materializer
 from zenml.integrations.pytorch.materializers.pytorch_module_materializer import (
+    CHECKPOINT_FILENAME,
     PyTorchModuleMaterializer,
 )
 
@@ -31,3 +34,23 @@ def test_pytorch_module_materializer(clean_client):
     assert module.in_features == 20
     assert module.out_features == 20
     assert module.bias is not None
+
+
+def test_pytorch_module_materializer_without_checkpoint(clean_client):
+    """Tests that the checkpoint file can be disabled."""
+
+    class NoCheckpointMaterializer(PyTorchModuleMaterializer):
+        SAVE_CHECKPOINT = False
+
+    def _validate(artifact_uri: str) -> None:
+        assert not os.path.exists(
+            os.path.join(artifact_uri, CHECKPOINT_FILENAME)
+        )
+
+    module = _test_materializer(
+        step_output=Linear(20, 20),
+        materializer_class=NoCheckpointMaterializer,
+        validation_function=_validate,
+    )
+
+    assert module.in_features == 20
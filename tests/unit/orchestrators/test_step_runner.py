@@ -171,3 +171,39 @@ def test_loading_unmaterialized_input_artifact(local_stack, clean_client):
         artifact=artifact_response, data_type=UnmaterializedArtifact
     )
     assert artifact.dict() == artifact_response.dict()
+
+
+def test_getting_model_versions_from_artifacts(mocker, local_stack):
+    """Tests that artifacts without a model don't hide the model versions of
+    the remaining artifacts."""
+    model_version = mocker.MagicMock(id=uuid4())
+    model = mocker.MagicMock()
+    model._get_or_create_model_version.return_value = model_version
+    artifact_configs = {
+        "no_config": None,
+        "no_model": mocker.MagicMock(_model=None),
+        "with_model": mocker.MagicMock(_model=model),
+    }
+    step_context = mocker.MagicMock()
+    step_context._get_output.side_effect = lambda name: mocker.MagicMock(
+        artifact_config=artifact_configs[name]
+    )
+    mocker.patch(
+        "zenml.orchestrators.step_runner.get_step_context",
+        return_value=step_context,
+    )
+
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "module.step_class",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    runner = StepRunner(step=step, stack=local_stack)
+    models = runner._get_model_versions_from_artifacts(list(artifact_configs))
+    assert models == {(model_version.model.id, model_version.id)}
@@ -111,6 +111,32 @@ def test_copy_dir_works(tmp_path):
         assert f.read() == "some_content_about_aria"
 
 
+def test_copy_dir_copies_nested_directories(tmp_path):
+    """Tests copying a directory with nested subdirectories."""
+    dir_path = os.path.join(tmp_path, "test")
+    for i in range(3):
+        io_utils.create_file_if_not_exists(
+            os.path.join(dir_path, "sub", "subsub", f"{i}.txt"), str(i)
+        )
+    io_utils.create_file_if_not_exists(
+        os.path.join(dir_path, "top.txt"), "top"
+    )
+
+    new_dir_path = os.path.join(tmp_path, "test2")
+    io_utils.copy_dir(dir_path, new_dir_path)
+
+    assert (
+        io_utils.read_file_contents_as_string(
+            os.path.join(new_dir_path, "top.txt")
+        )
+        == "top"
+    )
+    for i in range(3):
+        assert io_utils.read_file_contents_as_string(
+            os.path.join(new_dir_path, "sub", "subsub", f"{i}.txt")
+        ) == str(i)
+
+
 def test_copy_dir_overwriting_works(tmp_path):
     """Tests copying directory overwriting."""
     dir_path = os.path.join(tmp_path, "test")
@@ -216,6 +242,14 @@ def test_is_remote_when_using_non_remote_prefix(filesystem):
     assert io_utils.is_remote(some_random_path) is False
 
 
+def test_is_local_path(tmp_path):
+    """is_local_path returns False for paths with any filesystem scheme."""
+    assert io_utils.is_local_path(str(tmp_path))
+    assert io_utils.is_local_path("relative/path")
+    assert not io_utils.is_local_path("s3://bucket/some_directory")
+    assert not io_utils.is_local_path("custom://bucket/some_directory")
+
+
 def test_create_file_if_not_exists(tmp_path) -> None:
     """Test that create_file_if_not_exists creates a file"""
     io_utils.create_file_if_not_exists(os.path.join(tmp_path, "new_file.txt"))